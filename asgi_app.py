@@ -0,0 +1,214 @@
+"""
+Modo de servicio asíncrono (ASGI) de la API de juegos
+Expone las rutas CRUD de /games y /health de app.py sobre Starlette, usando
+SQLAlchemy asyncio con el driver asyncpg: una petición que espera a PostgreSQL
+no retiene un hilo del sistema operativo.
+
+Reutiliza el modelo, las validaciones y la codificación JSON de app.py, por lo que
+las respuestas son idénticas byte a byte a las del modo Flask.
+Uso: uvicorn asgi_app:app --host 0.0.0.0 --port 5001 --workers 4
+"""
+
+from contextlib import asynccontextmanager
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from werkzeug.datastructures import MIMEAccept
+from werkzeug.http import parse_accept_header, parse_etags
+from starlette.applications import Starlette
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+
+from app import (
+    Game, IF_MATCH_FAILED, ListQuery, NDJSON_MIMETYPE, VERSIONED_ROW_COLUMNS, app as flask_app,
+    db, delete_game_statement, driver_database_uri, encode_json, game_dict, game_etag,
+    if_match_versions, json_body, parse_game_fields, row_dict, update_game_statement,
+    versioned_entry
+)
+
+# Mismas opciones de pool que app.py salvo poolclass (el engine asíncrono usa su propio pool)
+# y connect_args, que son del driver síncrono; asyncpg ya prepara las sentencias en el servidor
+engine = create_async_engine(
+    driver_database_uri(flask_app.config['SQLALCHEMY_DATABASE_URI'], 'asyncpg'),
+    **{
+        option: value
+        for option, value in flask_app.config['SQLALCHEMY_ENGINE_OPTIONS'].items()
+        if option not in ('poolclass', 'connect_args')
+    }
+)
+Session = async_sessionmaker(engine, expire_on_commit=False)
+
+def json_response(obj, status=200):
+    return Response(json_body(obj), status_code=status, media_type='application/json')
+
+def not_found():
+    return json_response({'error': 'Juego no encontrado'}, 404)
+
+def etag_json_response(body, etag, status=200):
+    return Response(body, status_code=status, media_type='application/json', headers={'ETag': f'"{etag}"'})
+
+def write_failed(etags):
+    """Mismo criterio que app.write_failed: con If-Match, 412 aunque el juego ya no exista"""
+    if etags:
+        return json_response({'error': IF_MATCH_FAILED}, 412)
+    return not_found()
+
+async def read_json(request):
+    """Equivalente a request.get_json() de Flask: None si el cuerpo no es JSON"""
+    try:
+        return await request.json()
+    except ValueError:
+        return None
+
+# ============================================
+# ENDPOINTS CRUD
+# ============================================
+
+async def stream_games(query, ndjson):
+    """Resultado completo leído con un cursor del servidor (mismo formato que app.stream_games)"""
+    batch_size = flask_app.config['GAMES_STREAM_BATCH_SIZE']
+    async with Session() as session:
+        result = await session.stream(
+            query.statement(paginate=False).execution_options(yield_per=batch_size)
+        )
+        if not ndjson:
+            yield b'['
+        separator = b''
+        async for batch in result.partitions():
+            if ndjson:
+                yield b''.join(encode_json(row_dict(row)) + b'\n' for row in batch)
+            else:
+                yield separator + b','.join(encode_json(row_dict(row)) for row in batch)
+                separator = b','
+        if not ndjson:
+            yield b']\n'
+
+async def get_all_games(request):
+    params = request.query_params
+    try:
+        query = ListQuery(params)
+    except ValueError as e:
+        return json_response({'error': f'Parámetros inválidos: {str(e)}'}, 400)
+
+    # Misma negociación que app.wants_stream (request.accept_mimetypes.best de Flask)
+    ndjson = parse_accept_header(request.headers.get('accept'), MIMEAccept).best == NDJSON_MIMETYPE
+    if params.get('stream') in ('1', 'true') or ndjson:
+        return StreamingResponse(
+            stream_games(query, ndjson),
+            media_type=NDJSON_MIMETYPE if ndjson else 'application/json'
+        )
+
+    try:
+        async with Session() as session:
+            result = await session.execute(query.statement())
+            rows = result.all()
+        return Response(query.page(rows), media_type='application/json')
+    except Exception as e:
+        return json_response({'error': str(e)}, 500)
+
+async def get_game(request):
+    async with Session() as session:
+        result = await session.execute(
+            db.select(*VERSIONED_ROW_COLUMNS).where(Game.__table__.c.id == request.path_params['game_id'])
+        )
+        row = result.first()
+
+    if row is None:
+        return not_found()
+
+    _, (body, etag) = versioned_entry(row)
+    return etag_json_response(body, etag)
+
+async def create_game(request):
+    data = await read_json(request)
+
+    if data is None:
+        return json_response({'error': 'Se requiere body JSON'}, 400)
+
+    try:
+        values = parse_game_fields(data)
+    except ValueError as e:
+        return json_response({'error': str(e)}, 400)
+
+    try:
+        async with Session() as session:
+            new_game = Game(**values)
+            session.add(new_game)
+            await session.commit()
+        body = json_body(game_dict(new_game))
+        return etag_json_response(body, game_etag(body, new_game.version), 201)
+    except Exception as e:
+        return json_response({'error': f'Error interno: {str(e)}'}, 500)
+
+async def update_game(request):
+    game_id = request.path_params['game_id']
+    data = await read_json(request)
+
+    try:
+        values = parse_game_fields(data, partial=True)
+    except ValueError as e:
+        return json_response({'error': str(e)}, 400)
+
+    etags = parse_etags(request.headers.get('if-match'))
+    versions = if_match_versions(etags)
+    async with Session() as session:
+        try:
+            result = await session.execute(update_game_statement(game_id, values, versions))
+            row = result.first()
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            return json_response({'error': f'Error interno: {str(e)}'}, 500)
+
+        if row is None:
+            return write_failed(etags)
+
+    _, (body, etag) = versioned_entry(row)
+    return etag_json_response(body, etag)
+
+async def delete_game(request):
+    game_id = request.path_params['game_id']
+    etags = parse_etags(request.headers.get('if-match'))
+    versions = if_match_versions(etags)
+    async with Session() as session:
+        try:
+            result = await session.execute(delete_game_statement(game_id, versions))
+            row = result.first()
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            return json_response({'error': f'Error interno: {str(e)}'}, 500)
+
+        if row is None:
+            return write_failed(etags)
+
+    return json_response({'message': f'Juego {game_id} eliminado correctamente'})
+
+async def health_check(request):
+    """Health check endpoint para Docker"""
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(db.text('SELECT 1'))
+        return json_response({'status': 'healthy', 'database': 'connected'})
+    except Exception as e:
+        return json_response({
+            'status': 'unhealthy',
+            'database': 'disconnected',
+            'error': str(e)
+        }, 503)
+
+@asynccontextmanager
+async def lifespan(app):
+    yield
+    await engine.dispose()
+
+app = Starlette(
+    routes=[
+        Route('/games', get_all_games, methods=['GET']),
+        Route('/games', create_game, methods=['POST']),
+        Route('/games/{game_id:int}', get_game, methods=['GET']),
+        Route('/games/{game_id:int}', update_game, methods=['PUT']),
+        Route('/games/{game_id:int}', delete_game, methods=['DELETE']),
+        Route('/health', health_check, methods=['GET']),
+    ],
+    lifespan=lifespan
+)
@@ -0,0 +1,273 @@
+"""
+Benchmark de los endpoints de la API contra un PostgreSQL local
+Para cada tamaño de catálogo (poblado con seeding.py) ejecuta cada ruta CRUD en proceso
+(cliente de pruebas de Flask) y/o a través de un socket local (servidor WSGI con hilos),
+y reporta throughput, latencias p50/p95/p99 y el desglose de Server-Timing
+(base de datos, serialización JSON y resto del endpoint). Guarda los resultados en JSON.
+El driver de PostgreSQL se elige con DB_DRIVER (psycopg2 o psycopg), igual que en app.py.
+Con --url el modo socket mide un servidor ya iniciado (gunicorn o uvicorn con asgi_app.py).
+Uso: python -m benchmarks.api --sizes 1000,100000 --requests 500 --output bench.json
+"""
+
+import argparse
+import http.client
+import json
+import os
+import platform
+import random
+import subprocess
+import threading
+import time
+from datetime import datetime, timezone
+from urllib.parse import quote, urlsplit
+
+# Configuración de la app para medir: Server-Timing activo, sin caché de lecturas
+# (se mediría la caché en lugar de la base de datos)
+os.environ.setdefault('GAMES_PROFILING', '1')
+os.environ.setdefault('GAMES_SLOW_QUERY_MS', '1000000')
+os.environ.setdefault('GAMES_CACHE_ENABLED', '0')
+
+from werkzeug.serving import WSGIRequestHandler, make_server
+
+from app import app, encode_cursor
+from seeding import generar_datos_prueba
+
+NUEVO_JUEGO = {
+    'nombre': 'Benchmark', 'genero': 'RPG', 'plataforma': 'PC',
+    'fecha_lanzamiento': '2024-01-01', 'precio': 19.99
+}
+
+# Búsquedas sobre el vocabulario de seeding.py: prefijos cortos (muchas coincidencias),
+# nombres casi completos (pocas) y términos sin resultados
+SEARCH_QUERIES = ['sup', 'mega', 'legend of', 'elden sou', 'cyber kart 4', 'final quest 123', 'zzzz']
+
+def percentile(sorted_values, pct):
+    """Percentil por rango más cercano de una lista ya ordenada"""
+    if not sorted_values:
+        return 0.0
+    index = max(int(round(pct / 100 * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+def parse_server_timing(header):
+    """{'db': ms, 'serialize': ms, ...} a partir de una cabecera Server-Timing"""
+    timings = {}
+    for metric in (header or '').split(','):
+        name, _, params = metric.strip().partition(';')
+        for param in params.split(';'):
+            key, _, value = param.partition('=')
+            if key.strip() == 'dur':
+                timings[name] = float(value)
+    return timings
+
+def build_requests(route, size, count, rng, created_ids):
+    """Lista de (método, ruta, cuerpo) para una ruta del benchmark"""
+    if route == 'GET /games':
+        return [('GET', f'/games?limit=100&cursor={encode_cursor(rng.randint(0, size))}', None)
+                for _ in range(count)]
+    if route == 'GET /games?genero&sort=-precio':
+        return [('GET', '/games?limit=100&genero=RPG&sort=-precio', None) for _ in range(count)]
+    if route == 'GET /games/<id>':
+        return [('GET', f'/games/{rng.randint(1, size)}', None) for _ in range(count)]
+    if route == 'GET /games/search':
+        return [('GET', f'/games/search?limit=20&q={quote(rng.choice(SEARCH_QUERIES))}', None)
+                for _ in range(count)]
+    if route == 'GET /games/stats':
+        return [('GET', '/games/stats', None) for _ in range(count)]
+    if route == 'POST /games':
+        return [('POST', '/games', NUEVO_JUEGO) for _ in range(count)]
+    if route == 'PUT /games/<id>':
+        return [('PUT', f'/games/{rng.randint(1, size)}', {'precio': round(rng.uniform(5, 70), 2)})
+                for _ in range(count)]
+    if route == 'DELETE /games/<id>':
+        # Borra los juegos creados por POST, así el catálogo vuelve a su tamaño original
+        ids = created_ids[:count]
+        del created_ids[:count]
+        return [('DELETE', f'/games/{game_id}', None) for game_id in ids]
+    raise ValueError(f'Ruta desconocida: {route}')
+
+ROUTES = [
+    'GET /games',
+    'GET /games?genero&sort=-precio',
+    'GET /games/<id>',
+    'GET /games/stats',
+    'GET /games/search',
+    'POST /games',
+    'PUT /games/<id>',
+    'DELETE /games/<id>',
+]
+
+class Sample:
+    __slots__ = ('latency_ms', 'status', 'timing', 'body')
+
+    def __init__(self, latency_ms, status, timing, body):
+        self.latency_ms = latency_ms
+        self.status = status
+        self.timing = timing
+        self.body = body
+
+def run_inprocess(requests):
+    """Ejecuta las peticiones en secuencia con el cliente de pruebas de Flask"""
+    client = app.test_client()
+    samples = []
+    for method, path, body in requests:
+        started = time.perf_counter()
+        response = client.open(path, method=method, json=body)
+        data = response.get_data()
+        latency = (time.perf_counter() - started) * 1000
+        samples.append(Sample(
+            latency, response.status_code, parse_server_timing(response.headers.get('Server-Timing')), data
+        ))
+        response.close()
+    return samples
+
+class KeepAliveHandler(WSGIRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_request(self, *args, **kwargs):
+        pass
+
+def start_server():
+    """Servidor WSGI con hilos en un puerto libre de 127.0.0.1; devuelve (servidor, puerto)"""
+    server = make_server('127.0.0.1', 0, app, threaded=True, request_handler=KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, server.server_port
+
+def run_socket(requests, host, port, concurrency):
+    """Reparte las peticiones entre concurrency hilos, cada uno con su conexión keep-alive"""
+    samples = []
+    lock = threading.Lock()
+
+    def worker(chunk):
+        connection = http.client.HTTPConnection(host, port)
+        local = []
+        for method, path, body in chunk:
+            payload = json.dumps(body).encode('utf-8') if body is not None else None
+            headers = {'Content-Type': 'application/json'} if payload else {}
+            started = time.perf_counter()
+            try:
+                connection.request(method, path, body=payload, headers=headers)
+                response = connection.getresponse()
+                data = response.read()
+            except (http.client.HTTPException, OSError):
+                # Conexión cerrada por el servidor (p. ej. reciclado de workers): cuenta como error
+                connection.close()
+                connection = http.client.HTTPConnection(host, port)
+                local.append(Sample((time.perf_counter() - started) * 1000, 599, {}, b''))
+                continue
+            latency = (time.perf_counter() - started) * 1000
+            local.append(Sample(
+                latency, response.status, parse_server_timing(response.getheader('Server-Timing')), data
+            ))
+        connection.close()
+        with lock:
+            samples.extend(local)
+
+    threads = [
+        threading.Thread(target=worker, args=(requests[i::concurrency],)) for i in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return samples
+
+def summarize(samples, elapsed):
+    latencies = sorted(sample.latency_ms for sample in samples)
+    timings = {}
+    for name in ('db', 'serialize', 'app', 'total'):
+        values = sorted(sample.timing[name] for sample in samples if name in sample.timing)
+        if values:
+            timings[name] = {'p50': round(percentile(values, 50), 3), 'mean': round(sum(values) / len(values), 3)}
+    return {
+        'requests': len(samples),
+        'errors': sum(1 for sample in samples if sample.status >= 400),
+        'throughput_rps': round(len(samples) / elapsed, 1) if elapsed else 0.0,
+        'latency_ms': {
+            'p50': round(percentile(latencies, 50), 3),
+            'p95': round(percentile(latencies, 95), 3),
+            'p99': round(percentile(latencies, 99), 3),
+            'mean': round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+        },
+        'server_timing_ms': timings,
+    }
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark de los endpoints de la API')
+    parser.add_argument('--sizes', default='1000,100000', help='tamaños de catálogo separados por comas')
+    parser.add_argument('--requests', type=int, default=500, help='peticiones por ruta')
+    parser.add_argument('--modes', default='inprocess,socket', help='inprocess, socket o ambos')
+    parser.add_argument('--concurrency', type=int, default=8, help='conexiones en el modo socket')
+    parser.add_argument('--routes', default=','.join(ROUTES), help='rutas a medir separadas por comas')
+    parser.add_argument('--seed', type=int, default=42, help='semilla de datos y peticiones')
+    parser.add_argument('--workers', type=int, default=1, help='procesos de seeding.py')
+    parser.add_argument('--skip-seed', action='store_true', help='usar el catálogo existente (un solo tamaño)')
+    parser.add_argument('--output', default='benchmark-results.json', help='archivo JSON de resultados')
+    parser.add_argument('--url', help='servidor externo para el modo socket (p. ej. http://127.0.0.1:5001)')
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    modes = [mode.strip() for mode in args.modes.split(',')]
+    routes = [route.strip() for route in args.routes.split(',')]
+    server, host, port = None, '127.0.0.1', None
+    if args.url:
+        target = urlsplit(args.url)
+        host, port = target.hostname, target.port or 80
+    elif 'socket' in modes:
+        server, port = start_server()
+
+    results = []
+    for size in sizes:
+        if not args.skip_seed:
+            generar_datos_prueba(size, args.seed, procesos=args.workers)
+        for mode in modes:
+            rng = random.Random(f'{args.seed}:{size}:{mode}')
+            created_ids = []
+            for route in routes:
+                requests = build_requests(route, size, args.requests, rng, created_ids)
+                started = time.perf_counter()
+                if mode == 'inprocess':
+                    samples = run_inprocess(requests)
+                else:
+                    samples = run_socket(requests, host, port, args.concurrency)
+                elapsed = time.perf_counter() - started
+                if route == 'POST /games':
+                    created_ids.extend(json.loads(s.body)['id'] for s in samples if s.status == 201)
+
+                summary = summarize(samples, elapsed)
+                results.append({'size': size, 'mode': mode, 'route': route, **summary})
+                latency = summary['latency_ms']
+                timing = summary['server_timing_ms']
+                print(f"{size:>9} {mode:<9} {route:<32} {summary['throughput_rps']:>9.1f} req/s  "
+                      f"p50 {latency['p50']:>7.2f}  p95 {latency['p95']:>7.2f}  p99 {latency['p99']:>7.2f} ms  "
+                      f"db {timing.get('db', {}).get('p50', 0):>6.2f}  "
+                      f"json {timing.get('serialize', {}).get('p50', 0):>6.2f}  "
+                      f"errores {summary['errors']}")
+
+    if server is not None:
+        server.shutdown()
+
+    report = {
+        'meta': {
+            'commit': git_commit(),
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'driver': app.config['DB_DRIVER'],
+            'url': args.url,
+            'requests_per_route': args.requests,
+            'concurrency': args.concurrency,
+            'seed': args.seed,
+        },
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"Resultados guardados en {args.output}")
+
+if __name__ == '__main__':
+    main()
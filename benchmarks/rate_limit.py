@@ -0,0 +1,84 @@
+"""
+Benchmark del límite de peticiones por cliente (SharedMemoryRateLimitStore y RateLimitMiddleware)
+Mide el costo de una petición permitida: take() en un proceso, take() con varios procesos
+compitiendo por la memoria compartida, y el middleware WSGI frente a la app sin él.
+Uso: python -m benchmarks.rate_limit [--ops 200000] [--clients 10000] [--processes 4]
+"""
+
+import argparse
+import multiprocessing
+import time
+
+from app import RateLimitMiddleware, SharedMemoryRateLimitStore
+
+# Bucket suficientemente grande para que todas las operaciones sean permitidas
+CAPACITY = 10 ** 9
+RATE = 10 ** 9
+
+def time_takes(store, keys, ops):
+    """Microsegundos por take() recorriendo keys de forma cíclica"""
+    count = len(keys)
+    started = time.perf_counter()
+    for i in range(ops):
+        store.take(keys[i % count], CAPACITY, RATE)
+    return (time.perf_counter() - started) / ops * 1e6
+
+def worker(store, keys, ops, results):
+    results.put(time_takes(store, keys, ops))
+
+def bench_processes(store, keys, ops, processes):
+    """Promedio de µs por take() con varios procesos usando la misma memoria compartida"""
+    results = multiprocessing.Queue()
+    workers = [
+        multiprocessing.Process(target=worker, args=(store, keys, ops, results))
+        for _ in range(processes)
+    ]
+    for process in workers:
+        process.start()
+    timings = [results.get() for _ in workers]
+    for process in workers:
+        process.join()
+    return sum(timings) / len(timings)
+
+def empty_app(environ, start_response):
+    start_response('200 OK', [('Content-Type', 'text/plain')])
+    return [b'ok']
+
+def time_wsgi(wsgi_app, ops):
+    """µs por petición WSGI mínima (GET /games desde una IP fija)"""
+    environ = {'REQUEST_METHOD': 'GET', 'PATH_INFO': '/games', 'REMOTE_ADDR': '10.0.0.1'}
+    start_response = lambda status, headers, exc_info=None: None
+    started = time.perf_counter()
+    for _ in range(ops):
+        for _ in wsgi_app(environ, start_response):
+            pass
+    return (time.perf_counter() - started) / ops * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark del límite de peticiones por cliente')
+    parser.add_argument('--ops', type=int, default=200000, help='operaciones por medición')
+    parser.add_argument('--clients', type=int, default=10000, help='claves distintas')
+    parser.add_argument('--processes', type=int, default=4, help='procesos concurrentes')
+    parser.add_argument('--slots', type=int, default=65536, help='ranuras del almacén')
+    args = parser.parse_args()
+
+    store = SharedMemoryRateLimitStore(args.slots)
+    keys = [f'read:10.0.{i // 256}.{i % 256}' for i in range(args.clients)]
+
+    results = [
+        ('take(), un cliente', time_takes(store, keys[:1], args.ops)),
+        (f'take(), {args.clients} clientes', time_takes(store, keys, args.ops)),
+        (f'take(), {args.processes} procesos concurrentes',
+         bench_processes(store, keys, args.ops, args.processes)),
+    ]
+    limited = RateLimitMiddleware(empty_app, store, {'read': (CAPACITY, RATE)})
+    plain = time_wsgi(empty_app, args.ops)
+    with_limit = time_wsgi(limited, args.ops)
+    results += [('WSGI sin límite', plain), ('WSGI con RateLimitMiddleware', with_limit)]
+
+    for label, micros in results:
+        print(f'{label:<40} {micros:8.2f} µs')
+    print(f"{'Sobrecosto del middleware':<40} {with_limit - plain:8.2f} µs")
+
+if __name__ == '__main__':
+    main()
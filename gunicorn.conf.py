@@ -0,0 +1,93 @@
+"""
+Configuración de Gunicorn para producción
+Servidor pre-fork: un proceso por worker (cada uno con su propio GIL) y varios hilos por worker.
+Uso: gunicorn -c gunicorn.conf.py app:app
+"""
+
+import os
+import tempfile
+
+
+def available_cores():
+    """Núcleos asignados al proceso (respeta los límites de CPU del contenedor)"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+
+# Workers: 2 × núcleos + 1 salvo que WEB_CONCURRENCY indique otro valor
+workers = int(os.getenv('WEB_CONCURRENCY', available_cores() * 2 + 1))
+worker_class = 'gthread'
+# Peticiones que un worker atiende a la vez (y conexiones del pool como máximo)
+request_threads = int(os.getenv('GUNICORN_THREADS', '4'))
+
+# app.py calcula pool_size/max_overflow por worker a partir de estas variables,
+# de modo que workers × pool nunca supere DB_CONNECTION_BUDGET
+os.environ['WEB_CONCURRENCY'] = str(workers)
+os.environ['GUNICORN_THREADS'] = str(request_threads)
+
+# El control de admisión de app.py deja pasar GAMES_ADMISSION_LIMIT peticiones (por defecto,
+# las conexiones del pool, como mucho request_threads) y encola GAMES_ADMISSION_QUEUE más.
+# Los hilos de gthread deben cubrir límite + cola y algunos más para responder los 503 y
+# /health: con solo request_threads hilos el exceso esperaría en la cola de gunicorn, antes
+# de llegar a la app, y la cola acotada nunca se llenaría
+ADMISSION_SPARE_THREADS = 2
+admission_limit = int(os.getenv('GAMES_ADMISSION_LIMIT', request_threads))
+admission_queue = int(os.getenv('GAMES_ADMISSION_QUEUE', admission_limit))
+threads = request_threads
+if admission_limit > 0:
+    threads = max(threads, admission_limit + admission_queue + ADMISSION_SPARE_THREADS)
+
+# Conexiones abiertas por worker. Las que tienen una petición y no encuentran hilo libre
+# esperan sin límite de tiempo; se acotan para que el exceso no se acumule en el worker
+worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', threads * 2))
+
+# Métricas de Prometheus en modo multiproceso: cada worker escribe sus valores en este
+# directorio y /metrics los agrega. Se vacía al arrancar para no sumar ejecuciones anteriores
+metrics_dir = os.environ.setdefault(
+    'PROMETHEUS_MULTIPROC_DIR', os.path.join(tempfile.gettempdir(), 'games-api-metrics')
+)
+os.makedirs(metrics_dir, exist_ok=True)
+for name in os.listdir(metrics_dir):
+    if name.endswith('.db'):
+        os.remove(os.path.join(metrics_dir, name))
+
+# Cargar la app en el proceso maestro antes del fork: los workers comparten la
+# versión del catálogo (memoria compartida) y arrancan sin volver a importar
+preload_app = True
+
+# Reciclar workers periódicamente (con jitter para que no se reinicien todos a la vez)
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', '10000'))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', '1000'))
+
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '30'))
+graceful_timeout = 30
+keepalive = 5
+
+accesslog = None
+errorlog = '-'
+
+
+def on_starting(server):
+    """Crea las tablas una sola vez, en el proceso maestro"""
+    from app import app, db
+    with app.app_context():
+        db.create_all()
+
+
+def post_fork(server, worker):
+    """Cada worker abre sus propias conexiones: no se heredan las del proceso maestro"""
+    from app import app, db, replica_router
+    with app.app_context():
+        db.engine.dispose(close=False)
+    for engine in replica_router.engines:
+        engine.dispose(close=False)
+
+
+def child_exit(server, worker):
+    """Descarta los gauges del worker terminado (los contadores e histogramas se conservan)"""
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
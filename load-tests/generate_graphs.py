@@ -1,15 +1,41 @@
 """
 Generador de Reportes HTML y Gráficos para k6
-Genera gráficos PNG y un reporte HTML completo desde resultados JSON de k6
+Genera gráficos PNG y un reporte HTML completo desde resultados JSON de k6.
+Si existe la salida por muestra de k6 (--out json, *-samples.json[.gz]), agrega además
+la evolución de p50/p95/p99 y throughput en el tiempo junto a los usuarios virtuales.
 """
 
+import argparse
+import gzip
+import html as html_lib
 import json
+import math
+import sys
 import matplotlib.pyplot as plt
 import matplotlib
 matplotlib.use('Agg')
+import re
+from collections import defaultdict
 from pathlib import Path
 from datetime import datetime
 
+# Ancho de cada intervalo de las series de tiempo (segundos)
+TIMELINE_BUCKET_SECONDS = 10
+
+# Umbrales del modo comparación: (cambio relativo, cambio absoluto, mayor es peor).
+# Una métrica solo cuenta como regresión si empeora más que ambos, así el ruido
+# de latencias muy bajas o de pocas requests no hace fallar la comparación
+REGRESSION_THRESHOLDS = {
+    'p95': (0.10, 5.0, True),           # +10 % y +5 ms
+    'p99': (0.15, 10.0, True),          # +15 % y +10 ms
+    'throughput': (0.05, 1.0, False),   # -5 % y -1 req/s
+    'error_rate': (0.0, 1.0, True),     # +1 punto porcentual
+}
+# Requests mínimas por endpoint para comparar sus percentiles
+MIN_ENDPOINT_SAMPLES = 100
+# z del intervalo de confianza de los percentiles por endpoint (99 %)
+QUANTILE_CONFIDENCE_Z = 2.58
+
 def load_test_summary(filename):
     """Carga el archivo JSON de resumen de k6"""
     try:
@@ -24,15 +50,12 @@ def calculate_error_rate(metrics):
     # k6 usa http_req_failed con passes/fails
     if 'http_req_failed' in metrics:
         failed_metric = metrics['http_req_failed']
-        # passes = 0 significa que las requests FALLARON
-        # fails = cuenta de requests exitosas (confuso pero así es k6)
-        # Actualización: revisar la estructura real
+        # http_req_failed es una métrica Rate: passes cuenta los valores verdaderos, es decir,
+        # las requests que SÍ fallaron (su "value" es la tasa de fallo); fails las exitosas
         if 'passes' in failed_metric and 'fails' in failed_metric:
             total = failed_metric['passes'] + failed_metric['fails']
             if total > 0:
-                # passes en http_req_failed = requests que NO fallaron
-                # fails en http_req_failed = requests que SÍ fallaron  
-                error_count = failed_metric['fails']
+                error_count = failed_metric['passes']
                 return (error_count / total) * 100
     
     # Fallback: checks
@@ -46,9 +69,204 @@ def calculate_error_rate(metrics):
     
     return 0.0
 
-def generate_metrics_graph(metrics, test_name, output_path):
-    """Genera gráfico de métricas"""
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+class QuantileSketch:
+    """
+    Sketch de cuantiles con error relativo acotado (cubetas logarítmicas, como DDSketch).
+    Su memoria depende del rango de valores y no de la cantidad de muestras, y dos sketches
+    se combinan sumando sus cubetas.
+    """
+
+    def __init__(self, relative_accuracy=0.01):
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.buckets = {}
+        self.zeros = 0
+        self.count = 0
+
+    def add(self, value):
+        self.count += 1
+        if value <= 0:
+            self.zeros += 1
+            return
+        index = math.ceil(math.log(value) / self.log_gamma)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def merge(self, other):
+        self.count += other.count
+        self.zeros += other.zeros
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        return self
+
+    def quantile(self, q):
+        if self.count == 0:
+            return 0.0
+        rank = q * (self.count - 1)
+        seen = self.zeros
+        if seen > rank:
+            return 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                return 2 * self.gamma ** index / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+ID_SEGMENT = re.compile(r'/\d+(?=/|$)')
+
+def endpoint_name(tags):
+    """'GET /games/<id>' a partir de los tags de una muestra de k6"""
+    url = tags.get('name') or tags.get('url', '')
+    path = url.split('://', 1)[-1]
+    path = '/' + path.split('/', 1)[1] if '/' in path else '/'
+    return f"{tags.get('method', '')} {ID_SEGMENT.sub('/<id>', path.split('?', 1)[0])}".strip()
+
+def parse_k6_time(value, cache):
+    """Segundos desde epoch de un timestamp de k6 (RFC 3339 con nanosegundos)"""
+    utc = value.endswith('Z')
+    offset = '+00:00' if utc else value[-6:]
+    key = value[:19] + offset
+    seconds = cache.get(key)
+    if seconds is None:
+        if len(cache) > 100000:
+            cache.clear()
+        seconds = cache[key] = datetime.fromisoformat(key).timestamp()
+    fraction = value[19:-1] if utc else value[19:-6]
+    return seconds + float(fraction) if fraction else seconds
+
+class Timeline:
+    """Series de tiempo por intervalo: sketch de latencia por endpoint, peticiones, fallos y VUs"""
+
+    def __init__(self, bucket_seconds=TIMELINE_BUCKET_SECONDS):
+        self.bucket_seconds = bucket_seconds
+        self.latency = defaultdict(dict)
+        self.requests = defaultdict(int)
+        self.failed = defaultdict(int)
+        self.endpoint_failed = defaultdict(int)
+        self.vus = {}
+
+    def add_duration(self, bucket, endpoint, value):
+        sketches = self.latency[bucket]
+        sketch = sketches.get(endpoint)
+        if sketch is None:
+            sketch = sketches[endpoint] = QuantileSketch()
+        sketch.add(value)
+        self.requests[bucket] += 1
+
+    def add_failed(self, bucket, endpoint, value):
+        self.failed[bucket] += value
+        self.endpoint_failed[endpoint] += value
+
+    def buckets(self):
+        return sorted(set(self.latency) | set(self.vus))
+
+    def duration(self):
+        """Segundos cubiertos por las muestras de latencia"""
+        if not self.latency:
+            return 0
+        return (max(self.latency) - min(self.latency) + 1) * self.bucket_seconds
+
+    def elapsed(self, buckets):
+        """Minutos desde el inicio de la prueba para cada intervalo"""
+        start = buckets[0] if buckets else 0
+        return [(bucket - start) * self.bucket_seconds / 60 for bucket in buckets]
+
+    def percentiles(self, buckets, quantiles=(0.5, 0.95, 0.99)):
+        series = {q: [] for q in quantiles}
+        for bucket in buckets:
+            merged = QuantileSketch()
+            for sketch in self.latency.get(bucket, {}).values():
+                merged.merge(sketch)
+            for q in quantiles:
+                series[q].append(merged.quantile(q) if merged.count else float('nan'))
+        return series
+
+    def endpoints(self):
+        """{endpoint: sketch de toda la prueba}"""
+        totals = {}
+        for sketches in self.latency.values():
+            for endpoint, sketch in sketches.items():
+                totals.setdefault(endpoint, QuantileSketch()).merge(sketch)
+        return dict(sorted(totals.items()))
+
+def load_test_samples(filename, bucket_seconds=TIMELINE_BUCKET_SECONDS):
+    """
+    Lee la salida NDJSON de k6 (--out json, opcionalmente .gz) línea a línea.
+    Solo conserva los sketches por intervalo, así la memoria no crece con el tamaño del archivo.
+    """
+    timeline = Timeline(bucket_seconds)
+    time_cache = {}
+    opener = gzip.open if str(filename).endswith('.gz') else open
+    try:
+        with opener(filename, 'rt', encoding='utf-8') as f:
+            for line in f:
+                if '"metric":"http_req_duration"' in line:
+                    metric = 'http_req_duration'
+                elif '"metric":"http_req_failed"' in line:
+                    metric = 'http_req_failed'
+                elif '"metric":"vus"' in line:
+                    metric = 'vus'
+                else:
+                    continue
+                try:
+                    sample = json.loads(line)
+                except ValueError:
+                    continue
+                if sample.get('type') != 'Point':
+                    continue
+                data = sample['data']
+                bucket = int(parse_k6_time(data['time'], time_cache) // bucket_seconds)
+                value = data['value']
+                if metric == 'http_req_duration':
+                    timeline.add_duration(bucket, endpoint_name(data.get('tags') or {}), value)
+                elif metric == 'http_req_failed':
+                    timeline.add_failed(bucket, endpoint_name(data.get('tags') or {}), int(value))
+                else:
+                    timeline.vus[bucket] = max(timeline.vus.get(bucket, 0), value)
+    except Exception as e:
+        print(f"❌ Error cargando {filename}: {e}")
+        return None
+    return timeline if timeline.requests else None
+
+def plot_vus(ax, timeline, buckets, minutes):
+    """Usuarios virtuales en un eje secundario, para ver las etapas de la prueba"""
+    if not timeline.vus:
+        return
+    ax_vus = ax.twinx()
+    ax_vus.step(minutes, [timeline.vus.get(bucket, 0) for bucket in buckets],
+                where='post', color='#9C27B0', alpha=0.35, label='VUs')
+    ax_vus.set_ylabel('VUs')
+
+def generate_timeline_graphs(ax_latency, ax_throughput, timeline):
+    """Latencia p50/p95/p99 y throughput en el tiempo, con los VUs de fondo"""
+    buckets = timeline.buckets()
+    minutes = timeline.elapsed(buckets)
+    series = timeline.percentiles(buckets)
+
+    for q, color in ((0.5, '#4CAF50'), (0.95, '#FF9800'), (0.99, '#F44336')):
+        ax_latency.plot(minutes, series[q], color=color, label=f'p{int(q * 100)}')
+    ax_latency.set_title('Latencia en el tiempo (ms)', fontweight='bold')
+    ax_latency.set_xlabel('Minutos')
+    ax_latency.set_ylabel('Milisegundos')
+    ax_latency.grid(alpha=0.3)
+    ax_latency.legend(loc='upper left')
+    plot_vus(ax_latency, timeline, buckets, minutes)
+
+    width = timeline.bucket_seconds
+    ax_throughput.plot(minutes, [timeline.requests.get(b, 0) / width for b in buckets],
+                       color='#009688', label='req/s')
+    ax_throughput.plot(minutes, [timeline.failed.get(b, 0) / width for b in buckets],
+                       color='#F44336', label='errores/s')
+    ax_throughput.set_title('Throughput en el tiempo', fontweight='bold')
+    ax_throughput.set_xlabel('Minutos')
+    ax_throughput.set_ylabel('Peticiones por segundo')
+    ax_throughput.grid(alpha=0.3)
+    ax_throughput.legend(loc='upper left')
+    plot_vus(ax_throughput, timeline, buckets, minutes)
+
+def generate_metrics_graph(metrics, test_name, output_path, timeline=None):
+    """Genera gráfico de métricas (y las series de tiempo si hay muestras de k6)"""
+    rows = 3 if timeline is not None else 2
+    fig, axes = plt.subplots(rows, 2, figsize=(14, 5 * rows))
     fig.suptitle(f'{test_name} - Resultados', fontsize=16, fontweight='bold')
     
     # 1. Response Time
@@ -115,13 +333,142 @@ def generate_metrics_graph(metrics, test_name, output_path):
         ax4.set_ylabel('Cantidad')
         ax4.grid(axis='y', alpha=0.3)
         ax4.text(0, vus_val, f'{int(vus_val)}', ha='center', va='bottom', fontweight='bold')
+
+    # 5-6. Series de tiempo
+    if timeline is not None:
+        generate_timeline_graphs(axes[2, 0], axes[2, 1], timeline)
     
     plt.tight_layout()
     plt.savefig(output_path, dpi=150, bbox_inches='tight')
     plt.close()
     print(f"✓ Gráfico: {output_path.name}")
 
-def generate_html_report(test_results, output_path):
+def quantile_band(sketch, q, z=QUANTILE_CONFIDENCE_Z):
+    """Intervalo de confianza del percentil q según la cantidad de muestras del sketch"""
+    spread = z * math.sqrt(q * (1 - q) / sketch.count)
+    return sketch.quantile(max(q - spread, 0.0)), sketch.quantile(min(q + spread, 1.0))
+
+def compare_metric(metric, baseline, candidate, baseline_band=None, candidate_band=None):
+    """
+    Delta de una métrica entre dos corridas. Con intervalos de confianza, el cambio se mide
+    entre los extremos más cercanos de ambos intervalos (lo que no se explica por el ruido).
+    """
+    relative, absolute, higher_is_worse = REGRESSION_THRESHOLDS[metric]
+    base_low, base_high = baseline_band or (baseline, baseline)
+    cand_low, cand_high = candidate_band or (candidate, candidate)
+    if higher_is_worse:
+        worse, better = cand_low - base_high, base_low - cand_high
+    else:
+        worse, better = base_low - cand_high, cand_low - base_high
+
+    limit = max(relative * abs(baseline), absolute)
+    if worse > limit:
+        status = 'regresión'
+    elif better > limit:
+        status = 'mejora'
+    else:
+        status = 'sin cambio'
+    return {
+        'metric': metric,
+        'baseline': baseline,
+        'candidate': candidate,
+        'delta_pct': (candidate - baseline) / baseline * 100 if baseline else None,
+        'status': status
+    }
+
+def endpoint_error_rate(timeline, endpoint, sketch):
+    """Tasa de error de un endpoint con la misma lógica que el resumen de k6"""
+    failed = timeline.endpoint_failed.get(endpoint, 0)
+    return calculate_error_rate({'http_req_failed': {'passes': failed, 'fails': sketch.count - failed}})
+
+def compare_runs(baseline_results, candidate_results):
+    """
+    Compara dos corridas (listas de process_reports) prueba por prueba: totales del resumen
+    de k6 y, si ambas corridas tienen muestras, cada endpoint con percentiles ruido-conscientes.
+    """
+    baseline_by_name = {result['name']: result for result in baseline_results}
+    rows = []
+    for candidate in candidate_results:
+        baseline = baseline_by_name.get(candidate['name'])
+        if baseline is None:
+            continue
+        base_metrics, cand_metrics = baseline['metrics'], candidate['metrics']
+        base_dur = base_metrics.get('http_req_duration', {})
+        cand_dur = cand_metrics.get('http_req_duration', {})
+
+        total = []
+        for metric, key in (('p95', 'p(95)'), ('p99', 'p(99)')):
+            if key in base_dur and key in cand_dur:
+                total.append(compare_metric(metric, base_dur[key], cand_dur[key]))
+        if 'http_reqs' in base_metrics and 'http_reqs' in cand_metrics:
+            total.append(compare_metric(
+                'throughput', base_metrics['http_reqs'].get('rate', 0), cand_metrics['http_reqs'].get('rate', 0)
+            ))
+        total.append(compare_metric(
+            'error_rate', calculate_error_rate(base_metrics), calculate_error_rate(cand_metrics)
+        ))
+        rows += [{'test': candidate['name'], 'endpoint': 'Total', **row} for row in total]
+
+        base_timeline, cand_timeline = baseline.get('timeline'), candidate.get('timeline')
+        if base_timeline is None or cand_timeline is None:
+            continue
+        base_endpoints = base_timeline.endpoints()
+        for endpoint, cand_sketch in cand_timeline.endpoints().items():
+            base_sketch = base_endpoints.get(endpoint)
+            if base_sketch is None:
+                continue
+            if min(base_sketch.count, cand_sketch.count) < MIN_ENDPOINT_SAMPLES:
+                rows.append({'test': candidate['name'], 'endpoint': endpoint, 'metric': 'muestras',
+                             'baseline': base_sketch.count, 'candidate': cand_sketch.count,
+                             'delta_pct': None, 'status': 'pocas muestras'})
+                continue
+            for metric, q in (('p95', 0.95), ('p99', 0.99)):
+                rows.append({'test': candidate['name'], 'endpoint': endpoint, **compare_metric(
+                    metric, base_sketch.quantile(q), cand_sketch.quantile(q),
+                    quantile_band(base_sketch, q), quantile_band(cand_sketch, q)
+                )})
+            rows.append({'test': candidate['name'], 'endpoint': endpoint, **compare_metric(
+                'throughput',
+                base_sketch.count / max(base_timeline.duration(), 1),
+                cand_sketch.count / max(cand_timeline.duration(), 1)
+            )})
+            rows.append({'test': candidate['name'], 'endpoint': endpoint, **compare_metric(
+                'error_rate',
+                endpoint_error_rate(base_timeline, endpoint, base_sketch),
+                endpoint_error_rate(cand_timeline, endpoint, cand_sketch)
+            )})
+
+    return {
+        'passed': not any(row['status'] == 'regresión' for row in rows),
+        'rows': rows
+    }
+
+def comparison_html(comparison, baseline_dir):
+    """Sección del reporte HTML con el veredicto y las diferencias contra la línea base"""
+    passed = comparison['passed']
+    badge = 'status-success' if passed else 'status-error'
+    verdict = 'Sin regresiones' if passed else 'Regresión detectada'
+    html = f"""
+        <div class="test-section">
+            <h2>Comparación con la línea base <span class="{badge} status-badge">{verdict}</span></h2>
+            <p>Línea base: {html_lib.escape(str(baseline_dir))}</p>
+            <table class="metrics-table">
+                <tr><th>Prueba</th><th>Endpoint</th><th>Métrica</th><th>Base</th><th>Candidato</th><th>Δ</th><th>Estado</th></tr>
+"""
+    status_classes = {'regresión': 'status-error', 'mejora': 'status-success', 'pocas muestras': 'status-warning'}
+    for row in comparison['rows']:
+        delta = f"{row['delta_pct']:+.1f}%" if row['delta_pct'] is not None else '-'
+        status_class = status_classes.get(row['status'], '')
+        html += f"""
+                <tr><td>{row['test']}</td><td>{html_lib.escape(row['endpoint'])}</td><td>{row['metric']}</td><td>{row['baseline']:.2f}</td><td>{row['candidate']:.2f}</td><td>{delta}</td><td><span class="{status_class} status-badge">{row['status']}</span></td></tr>
+"""
+    html += """
+            </table>
+        </div>
+"""
+    return html
+
+def generate_html_report(test_results, output_path, comparison=None, baseline_dir=None):
     """Genera reporte HTML completo"""
     html = """
 <!DOCTYPE html>
@@ -272,6 +619,9 @@ def generate_html_report(test_results, output_path):
             </div>
         </div>
 """
+
+    if comparison is not None:
+        html += comparison_html(comparison, baseline_dir)
     
     # Test sections
     for result in test_results:
@@ -317,6 +667,19 @@ def generate_html_report(test_results, output_path):
             </table>
 """
         
+        timeline = result.get('timeline')
+        if timeline is not None:
+            html += """
+            <h3>Latencia por Endpoint (muestras k6)</h3>
+            <table class="metrics-table">
+                <tr><th>Endpoint</th><th>Requests</th><th>p50 (ms)</th><th>p95 (ms)</th><th>p99 (ms)</th></tr>
+"""
+            for endpoint, sketch in timeline.endpoints().items():
+                html += f"""
+                <tr><td>{html_lib.escape(endpoint)}</td><td>{sketch.count}</td><td>{sketch.quantile(0.5):.2f}</td><td>{sketch.quantile(0.95):.2f}</td><td>{sketch.quantile(0.99):.2f}</td></tr>
+"""
+            html += "</table>"
+
         html += f"""
             <h3>Tasa de Éxito</h3>
             <table class="metrics-table">
@@ -351,52 +714,103 @@ def generate_html_report(test_results, output_path):
     
     print(f"✓ Reporte HTML: {output_path}")
 
-def process_all_tests():
-    """Procesa todos los tests y genera gráficos + HTML"""
-    reports_dir = Path('./load-tests/reports')
-    
-    if not reports_dir.exists():
-        print(f"❌ Directorio {reports_dir} no existe")
-        return
-    
+def find_samples(reports_dir, prefix):
+    """Muestras por petición (k6 --out json) de una prueba, si las generó"""
+    for samples_file in (reports_dir / f"{prefix}-samples.json.gz", reports_dir / f"{prefix}-samples.json"):
+        if samples_file.exists():
+            return samples_file
+    return None
+
+def process_reports(reports_dir, render=True):
+    """Carga resúmenes y muestras de un directorio de reportes (y genera sus gráficos si render)"""
     summary_files = list(reports_dir.glob('*-summary.json'))
-    
-    if not summary_files:
-        print("⚠️  No se encontraron archivos de resumen")
-        return
-    
-    print(f"\n📊 Procesando {len(summary_files)} pruebas...\n")
-    
     test_results = []
     
     for summary_file in sorted(summary_files):
         test_name = summary_file.stem.replace('-summary', '').replace('-', ' ').title()
-        print(f"Procesando: {test_name}")
+        print(f"Procesando: {test_name} ({reports_dir})")
         
         data = load_test_summary(summary_file)
         if data is None:
             continue
         
         metrics = data.get('metrics', {})
+        prefix = summary_file.stem.replace('-summary', '')
+
+        samples_file = find_samples(reports_dir, prefix)
+        timeline = load_test_samples(samples_file) if samples_file else None
         
         # Generar gráfico
-        graph_path = reports_dir / f"{summary_file.stem.replace('-summary', '')}-graph.png"
-        generate_metrics_graph(metrics, test_name, graph_path)
+        graph_path = reports_dir / f"{prefix}-graph.png"
+        if render:
+            generate_metrics_graph(metrics, test_name, graph_path, timeline)
         
         test_results.append({
             'name': test_name,
             'metrics': metrics,
-            'graph_path': str(graph_path)
+            'graph_path': str(graph_path),
+            'timeline': timeline
         })
+    return test_results
+
+def print_comparison(comparison):
+    for row in comparison['rows']:
+        if row['status'] == 'sin cambio':
+            continue
+        delta = f"{row['delta_pct']:+.1f}%" if row['delta_pct'] is not None else '-'
+        print(f"  {row['test']:<14} {row['endpoint']:<22} {row['metric']:<11} "
+              f"{row['baseline']:>10.2f} -> {row['candidate']:>10.2f} {delta:>8}  {row['status']}")
+    if comparison['passed']:
+        print("\n✅ Sin regresiones respecto de la línea base")
+    else:
+        print("\n❌ Regresión de rendimiento respecto de la línea base")
+
+def process_all_tests(reports_dir='./load-tests/reports', baseline_dir=None):
+    """
+    Procesa todos los tests y genera gráficos + HTML. Con baseline_dir compara además
+    contra esa corrida; devuelve 1 si hay regresiones (código de salida) y 0 si no.
+    """
+    reports_dir = Path(reports_dir)
+    
+    if not reports_dir.exists():
+        print(f"❌ Directorio {reports_dir} no existe")
+        return 2
+    
+    if not list(reports_dir.glob('*-summary.json')):
+        print("⚠️  No se encontraron archivos de resumen")
+        return 2
+    
+    print(f"\n📊 Procesando {reports_dir}...\n")
+    test_results = process_reports(reports_dir)
+    
+    comparison = None
+    if baseline_dir is not None:
+        baseline_dir = Path(baseline_dir)
+        baseline_results = process_reports(baseline_dir, render=False) if baseline_dir.exists() else []
+        if not baseline_results:
+            print(f"❌ No se encontraron resúmenes de la línea base en {baseline_dir}")
+            return 2
+        comparison = compare_runs(baseline_results, test_results)
+        print_comparison(comparison)
     
     # Generar HTML
     if test_results:
         html_path = reports_dir / 'test-results.html'
-        generate_html_report(test_results, html_path)
+        generate_html_report(test_results, html_path, comparison, baseline_dir)
     
     print(f"\n✅ Procesamiento completado")
     print(f"📁 Resultados en: {reports_dir}")
     print(f"🌐 Abrir: {reports_dir / 'test-results.html'}")
+    return 0 if comparison is None or comparison['passed'] else 1
+
+def main():
+    parser = argparse.ArgumentParser(description='Gráficos y reporte HTML de las pruebas k6')
+    parser.add_argument('--reports', default='./load-tests/reports', help='directorio de la corrida a reportar')
+    parser.add_argument('--baseline', default=None,
+                        help='directorio de una corrida anterior (p. ej. ./load-tests/baseline); compara contra '
+                             'ella y sale con 1 si hay regresiones')
+    args = parser.parse_args()
+    sys.exit(process_all_tests(args.reports, args.baseline))
 
 if __name__ == '__main__':
-    process_all_tests()
+    main()
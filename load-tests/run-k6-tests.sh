@@ -10,6 +10,15 @@ echo "  Ejecutando con k6 en Docker"
 echo "=========================================="
 echo ""
 
+# URL de la API bajo prueba y directorio de reportes (configurables para comparar modos)
+export BASE_URL=${BASE_URL:-http://api:5000}
+REPORTS_DIR=${REPORTS_DIR:-/reports}
+mkdir -p "$REPORTS_DIR"
+
+# Corrida anterior contra la que comparar al final (opcional, p. ej. /load-tests/baseline, que es
+# load-tests/baseline en el host): el script sale con 1 si hay regresiones
+BASELINE_DIR=${BASELINE_DIR:-}
+
 # Colores
 RED='\033[0;31m'
 GREEN='\033[0;32m'
@@ -24,7 +33,7 @@ wait_for_api() {
     attempt=0
     
     while [ $attempt -lt $max_attempts ]; do
-        if wget -q --spider http://api:5000/health 2>/dev/null; then
+        if wget -q --spider ${BASE_URL}/health 2>/dev/null; then
             echo "${GREEN}✓ API está lista${NC}"
             return 0
         fi
@@ -46,9 +55,12 @@ run_k6_test() {
     echo ""
     echo "${CYAN}==> Ejecutando: $test_name${NC}"
     
+    # Además del resumen, cada muestra en NDJSON comprimido (series de tiempo en generate_graphs.py)
     k6 run \
-        --summary-export=/reports/${output_file}-summary.json \
-        /scripts/${test_script} | tee /reports/${output_file}-log.txt
+        --summary-export=${REPORTS_DIR}/${output_file}-summary.json \
+        --summary-trend-stats="avg,min,med,max,p(90),p(95),p(99)" \
+        --out json=${REPORTS_DIR}/${output_file}-samples.json.gz \
+        /scripts/${test_script} | tee ${REPORTS_DIR}/${output_file}-log.txt
     
     if [ $? -eq 0 ]; then
         echo "${GREEN}✓ $test_name completado${NC}"
@@ -96,6 +108,21 @@ echo "==========================================${NC}"
 
 run_k6_test "spike-test.js" "Spike Test" "spike-test"
 
+if [ -n "$BASELINE_DIR" ]; then
+    echo ""
+    echo "${YELLOW}=========================================="
+    echo "  COMPARACIÓN CON LA LÍNEA BASE"
+    echo "==========================================${NC}"
+
+    gate_status=0
+    python3 /load-tests/generate_graphs.py --reports "$REPORTS_DIR" --baseline "$BASELINE_DIR" || gate_status=$?
+    if [ $gate_status -ne 0 ]; then
+        echo "${RED}✗ Regresión de rendimiento respecto de $BASELINE_DIR${NC}"
+        exit $gate_status
+    fi
+    echo "${GREEN}✓ Sin regresiones respecto de $BASELINE_DIR${NC}"
+fi
+
 echo ""
 echo "${GREEN}=========================================="
 echo "  ✓ TODAS LAS PRUEBAS COMPLETADAS"
@@ -99,7 +99,9 @@ function Invoke-K6Test {
     
     $k6Cmd = "k6 run " +
              "--out influxdb=http://localhost:8086/k6 " +
+             "--out json=.\load-tests\reports\$OutputFile-samples.json.gz " +
              "--summary-export=.\load-tests\reports\$OutputFile-summary.json " +
+             "--summary-trend-stats=`"avg,min,med,max,p(90),p(95),p(99)`" " +
              ".\load-tests\scripts\$TestScript"
     
     try {
@@ -62,9 +62,9 @@ export default function () {
         const res = http.get(`${BASE_URL}/games`);
         check(res, {
             'GET /games status 200': (r) => r.status === 200,
-            'GET /games is array': (r) => {
+            'GET /games is page': (r) => {
                 try {
-                    return Array.isArray(JSON.parse(r.body));
+                    return Array.isArray(JSON.parse(r.body).games);
                 } catch {
                     return false;
                 }
@@ -0,0 +1,4 @@
+#!/bin/sh
+# Se ejecuta una sola vez al inicializar el volumen del primario (docker-entrypoint-initdb.d):
+# permite conexiones de replicación desde la red de Docker para la réplica de lectura.
+echo "host replication all all scram-sha-256" >> "$PGDATA/pg_hba.conf"
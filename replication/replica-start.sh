@@ -0,0 +1,14 @@
+#!/bin/sh
+# Arranque de la réplica de lectura: la primera vez clona el primario con pg_basebackup
+# (-R deja la configuración de standby) y luego inicia PostgreSQL en modo solo lectura.
+set -e
+
+if [ ! -s "$PGDATA/PG_VERSION" ]; then
+    until pg_basebackup -h postgres -U postgres -D "$PGDATA" -R -X stream; do
+        echo "Esperando al primario..."
+        sleep 2
+    done
+    chmod 0700 "$PGDATA"
+fi
+
+exec postgres
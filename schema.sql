@@ -1,4 +1,7 @@
 DROP TABLE IF EXISTS games;
+DROP TABLE IF EXISTS game_stats;
+DROP TABLE IF EXISTS game_changes;
+DROP TABLE IF EXISTS game_changes_horizon;
 
 CREATE TABLE games (
     id SERIAL PRIMARY KEY,
@@ -6,5 +9,132 @@ CREATE TABLE games (
     genero VARCHAR(100) NOT NULL,
     plataforma VARCHAR(100) NOT NULL,
     fecha_lanzamiento DATE NOT NULL,
-    precio DECIMAL(10,2) NOT NULL
-);
\ No newline at end of file
+    precio DECIMAL(10,2) NOT NULL,
+    version INTEGER NOT NULL DEFAULT 1
+);
+
+-- Índices para los filtros y órdenes de GET /games (deben coincidir con Game.__table_args__).
+-- Cada índice termina en id, el desempate del cursor de paginación.
+CREATE INDEX ix_games_genero_id ON games (genero, id);
+CREATE INDEX ix_games_plataforma_id ON games (plataforma, id);
+CREATE INDEX ix_games_genero_plataforma_id ON games (genero, plataforma, id);
+CREATE INDEX ix_games_genero_plataforma_precio_id ON games (genero, plataforma, precio, id);
+CREATE INDEX ix_games_genero_precio_id ON games (genero, precio, id);
+CREATE INDEX ix_games_precio_id ON games (precio, id);
+CREATE INDEX ix_games_fecha_lanzamiento_id ON games (fecha_lanzamiento, id);
+
+-- Búsqueda por nombre (GET /games/search): texto completo con la configuración 'simple'
+-- (prefijos de palabras), nombres que empiezan por el texto buscado y trigramas para
+-- coincidencias aproximadas
+CREATE INDEX ix_games_nombre_fts ON games USING gin (to_tsvector('simple'::regconfig, nombre));
+CREATE INDEX ix_games_nombre_prefix ON games ((lower(nombre) COLLATE "C"));
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX ix_games_nombre_trgm ON games USING gin (lower(nombre) gin_trgm_ops);
+
+-- Agregados por (genero, plataforma) para GET /games/stats, mantenidos por triggers.
+-- Tras una carga o ante una inconsistencia: flask --app app rebuild-stats
+CREATE TABLE game_stats (
+    genero VARCHAR(100) NOT NULL,
+    plataforma VARCHAR(100) NOT NULL,
+    cantidad INTEGER NOT NULL,
+    suma_precio DECIMAL(14,2) NOT NULL,
+    precio_min DECIMAL(10,2) NOT NULL,
+    precio_max DECIMAL(10,2) NOT NULL,
+    PRIMARY KEY (genero, plataforma)
+);
+
+CREATE OR REPLACE FUNCTION games_stats_trigger() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE game_stats SET
+            cantidad = cantidad - 1,
+            suma_precio = suma_precio - OLD.precio
+        WHERE genero = OLD.genero AND plataforma = OLD.plataforma;
+
+        UPDATE game_stats SET
+            precio_min = COALESCE((SELECT min(precio) FROM games
+                WHERE genero = OLD.genero AND plataforma = OLD.plataforma), 0),
+            precio_max = COALESCE((SELECT max(precio) FROM games
+                WHERE genero = OLD.genero AND plataforma = OLD.plataforma), 0)
+        WHERE genero = OLD.genero AND plataforma = OLD.plataforma
+          AND (OLD.precio <= precio_min OR OLD.precio >= precio_max);
+
+        DELETE FROM game_stats
+        WHERE genero = OLD.genero AND plataforma = OLD.plataforma AND cantidad <= 0;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO game_stats (genero, plataforma, cantidad, suma_precio, precio_min, precio_max)
+        VALUES (NEW.genero, NEW.plataforma, 1, NEW.precio, NEW.precio, NEW.precio)
+        ON CONFLICT (genero, plataforma) DO UPDATE SET
+            cantidad = game_stats.cantidad + 1,
+            suma_precio = game_stats.suma_precio + EXCLUDED.suma_precio,
+            precio_min = LEAST(game_stats.precio_min, EXCLUDED.precio_min),
+            precio_max = GREATEST(game_stats.precio_max, EXCLUDED.precio_max);
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER games_stats_insert AFTER INSERT ON games
+FOR EACH ROW EXECUTE FUNCTION games_stats_trigger();
+
+CREATE TRIGGER games_stats_update AFTER UPDATE OF genero, plataforma, precio ON games
+FOR EACH ROW
+WHEN (OLD.genero IS DISTINCT FROM NEW.genero
+      OR OLD.plataforma IS DISTINCT FROM NEW.plataforma
+      OR OLD.precio IS DISTINCT FROM NEW.precio)
+EXECUTE FUNCTION games_stats_trigger();
+
+CREATE TRIGGER games_stats_delete AFTER DELETE ON games
+FOR EACH ROW EXECUTE FUNCTION games_stats_trigger();
+
+-- Registro de cambios para GET /games/changes: una fila por juego con el id de la última
+-- transacción que lo escribió; los borrados quedan como tombstones hasta que se purgan.
+-- Tras una carga masiva: flask --app app reset-changes
+CREATE TABLE game_changes (
+    game_id INTEGER PRIMARY KEY,
+    txid BIGINT NOT NULL,
+    deleted BOOLEAN NOT NULL,
+    changed_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+CREATE INDEX ix_game_changes_txid_game_id ON game_changes (txid, game_id);
+CREATE INDEX ix_game_changes_tombstones ON game_changes (changed_at) WHERE deleted;
+
+-- Los tokens con txid menor que purged_txid deben resincronizar el catálogo
+CREATE TABLE game_changes_horizon (
+    id INTEGER PRIMARY KEY,
+    purged_txid BIGINT NOT NULL
+);
+INSERT INTO game_changes_horizon (id, purged_txid) VALUES (1, 0);
+
+CREATE OR REPLACE FUNCTION games_changes_trigger() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO game_changes (game_id, txid, deleted, changed_at)
+    VALUES (
+        CASE WHEN TG_OP = 'DELETE' THEN OLD.id ELSE NEW.id END,
+        pg_current_xact_id()::text::bigint, TG_OP = 'DELETE', now()
+    )
+    ON CONFLICT (game_id) DO UPDATE SET
+        txid = EXCLUDED.txid,
+        deleted = EXCLUDED.deleted,
+        changed_at = EXCLUDED.changed_at;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER games_changes AFTER INSERT OR UPDATE OR DELETE ON games
+FOR EACH ROW EXECUTE FUNCTION games_changes_trigger();
+
+-- TRUNCATE no dispara triggers por fila: vacía el registro y adelanta el horizonte
+CREATE OR REPLACE FUNCTION games_changes_truncate_trigger() RETURNS TRIGGER AS $$
+BEGIN
+    DELETE FROM game_changes;
+    UPDATE game_changes_horizon SET purged_txid = pg_current_xact_id()::text::bigint WHERE id = 1;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER games_changes_truncate AFTER TRUNCATE ON games
+FOR EACH STATEMENT EXECUTE FUNCTION games_changes_truncate_trigger();
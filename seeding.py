@@ -1,48 +1,169 @@
 """
 seeding.py
-Script para poblar la base de datos con 50 juegos de prueba iniciales.
+Script para poblar la base de datos con juegos de prueba generados de forma determinista.
+Carga las filas con COPY en lotes (opcionalmente con varios procesos), eliminando los
+índices secundarios durante la carga y recreándolos al final.
+Uso: python seeding.py --rows 10000000 --seed 42 --workers 4
 """
+import argparse
+import io
+import multiprocessing
 import random
+import time
 from datetime import date, timedelta
-from app import app, db, Game
+from app import app, db, Game, GAME_TRIGRAM_DDL, rebuild_stats, reset_change_feed
 
 NOMBRES = ["Super", "Mega", "Ultra", "Hyper", "The Legend of", "Final", "Dark", "Cyber", "Elden", "Call of"]
 SUFIJOS = ["Warrior", "Quest", "Saga", "Souls", "Kart", "Fighter", "Survivor", "Revenge", "Mission", "World"]
 GENEROS = ["Acción", "Aventura", "RPG", "Estrategia", "Deportes", "Carreras", "Shooter", "Terror"]
 PLATAFORMAS = ["PC", "PS5", "Xbox Series X", "Nintendo Switch"]
 
-def generar_datos_prueba():
-    with app.app_context():
-        print("--- Iniciando Seeding ---")
+FECHA_BASE = date(2020, 1, 1)
+COPY_SQL = "COPY games (id, nombre, genero, plataforma, fecha_lanzamiento, precio) FROM STDIN"
+# Índice GIN de pg_trgm: lo crea un evento DDL (GAME_TRIGRAM_DDL), no está en Game.__table__.indexes
+INDICE_TRIGRAMAS = "ix_games_nombre_trgm"
+
+def generar_filas(inicio, cantidad, semilla):
+    """
+    Genera las filas con ids inicio+1 .. inicio+cantidad. Cada lote usa su propio generador
+    derivado de (semilla, inicio), así el resultado no depende del número de procesos.
+    """
+    rng = random.Random(f"{semilla}:{inicio}")
+    for game_id in range(inicio + 1, inicio + cantidad + 1):
+        yield (
+            game_id,
+            f"{rng.choice(NOMBRES)} {rng.choice(SUFIJOS)} {rng.randint(1, 999)}",
+            rng.choice(GENEROS),
+            rng.choice(PLATAFORMAS),
+            FECHA_BASE + timedelta(days=rng.randint(0, 1000)),
+            round(rng.uniform(9.99, 79.99), 2)
+        )
+
+def lote_copy(filas):
+    """Texto en formato COPY (columnas separadas por tabuladores) para un lote de filas"""
+    buffer = io.StringIO()
+    for game_id, nombre, genero, plataforma, fecha, precio in filas:
+        buffer.write(f"{game_id}\t{nombre}\t{genero}\t{plataforma}\t{fecha.isoformat()}\t{precio}\n")
+    buffer.seek(0)
+    return buffer
 
-        # Limpiar tabla para evitar duplicados en pruebas
+def cargar_lote(args):
+    """Carga un lote con COPY en su propia conexión y transacción; devuelve las filas cargadas"""
+    inicio, cantidad, semilla = args
+    with app.app_context():
+        conexion = db.engine.raw_connection()
         try:
-            db.session.query(Game).delete()
-        except Exception:
-            pass # Si la tabla no existe o falla, continuar
+            with conexion.cursor() as cursor:
+                datos = lote_copy(generar_filas(inicio, cantidad, semilla))
+                if hasattr(cursor, 'copy_expert'):
+                    cursor.copy_expert(COPY_SQL, datos)
+                else:
+                    # psycopg 3 (DB_DRIVER=psycopg)
+                    with cursor.copy(COPY_SQL) as copia:
+                        copia.write(datos.getvalue())
+            conexion.commit()
+        finally:
+            conexion.close()
+    return cantidad
+
+def iniciar_proceso():
+    """Cada proceso hijo abre sus propias conexiones (no reutiliza las heredadas del padre)"""
+    with app.app_context():
+        db.engine.dispose(close=False)
 
-        juegos_lista = []
-        CANTIDAD = 50
+def lotes(cantidad, tamano_lote, semilla):
+    for inicio in range(0, cantidad, tamano_lote):
+        yield inicio, min(tamano_lote, cantidad - inicio), semilla
 
-        print(f"Generando {CANTIDAD} juegos de prueba...")
+def generar_datos_prueba(cantidad=50, semilla=None, tamano_lote=50000, procesos=1, recrear_indices=True):
+    """
+    Reemplaza el contenido de games por cantidad juegos generados con semilla.
+    Devuelve las filas por segundo de la carga (sin contar la recreación de índices).
+    """
+    if semilla is None:
+        semilla = random.randrange(2 ** 32)
+    indices = list(Game.__table__.indexes) if recrear_indices else []
+    trigramas = False
 
-        for i in range(CANTIDAD):
-            nombre_juego = f"{random.choice(NOMBRES)} {random.choice(SUFIJOS)} {random.randint(1, 999)}"
+    with app.app_context():
+        print("--- Iniciando Seeding ---")
+        db.create_all()
 
-            nuevo_juego = Game(
-                nombre=nombre_juego,
-                genero=random.choice(GENEROS),
-                plataforma=random.choice(PLATAFORMAS),
-                fecha_lanzamiento=date(2020, 1, 1) + timedelta(days=random.randint(0, 1000)),
-                precio=round(random.uniform(9.99, 79.99), 2)
-            )
-            juegos_lista.append(nuevo_juego)
+        # Limpiar tabla para evitar duplicados en pruebas. Durante la carga se desactivan
+        # los triggers de game_stats, que se recalcula una sola vez al final
+        with db.engine.begin() as conexion:
+            conexion.execute(db.text("TRUNCATE games RESTART IDENTITY"))
+            conexion.execute(db.text("ALTER TABLE games DISABLE TRIGGER USER"))
+            for indice in indices:
+                indice.drop(conexion, checkfirst=True)
+            if recrear_indices:
+                trigramas = conexion.execute(
+                    db.text("SELECT to_regclass(:indice) IS NOT NULL"), {"indice": INDICE_TRIGRAMAS}
+                ).scalar()
+                conexion.execute(db.text(f"DROP INDEX IF EXISTS {INDICE_TRIGRAMAS}"))
+        db.engine.dispose()
 
-        db.session.bulk_save_objects(juegos_lista)
-        db.session.commit()
+    print(f"Generando {cantidad} juegos de prueba (semilla {semilla}, lotes de {tamano_lote}, "
+          f"{procesos} proceso(s))...")
+    inicio_carga = time.perf_counter()
+    cargadas = 0
+    trabajos = lotes(cantidad, tamano_lote, semilla)
+    try:
+        if procesos > 1:
+            with multiprocessing.Pool(procesos, initializer=iniciar_proceso) as pool:
+                for filas in pool.imap_unordered(cargar_lote, trabajos):
+                    cargadas += filas
+                    print(f"  {cargadas}/{cantidad} filas", end="\r")
+        else:
+            for trabajo in trabajos:
+                cargadas += cargar_lote(trabajo)
+                print(f"  {cargadas}/{cantidad} filas", end="\r")
+    finally:
+        # Aunque la carga falle, la tabla recupera sus índices y triggers
+        duracion_carga = time.perf_counter() - inicio_carga
+        with app.app_context():
+            inicio_indices = time.perf_counter()
+            with db.engine.begin() as conexion:
+                for indice in indices:
+                    indice.create(conexion, checkfirst=True)
+                if trigramas:
+                    for sentencia in GAME_TRIGRAM_DDL:
+                        conexion.execute(db.text(sentencia))
+                conexion.execute(db.text(
+                    "SELECT setval(pg_get_serial_sequence('games', 'id'), GREATEST(MAX(id), 1)) FROM games"
+                ))
+                conexion.execute(db.text("ALTER TABLE games ENABLE TRIGGER USER"))
+            duracion_indices = time.perf_counter() - inicio_indices
+
+    filas_por_segundo = cargadas / duracion_carga if duracion_carga else 0.0
+    print(f"\nCarga: {cargadas} filas en {duracion_carga:.2f} s ({filas_por_segundo:,.0f} filas/s)")
+    print(f"Índices recreados en {duracion_indices:.2f} s")
+
+    with app.app_context():
+        grupos = rebuild_stats()
+        # El catálogo se reemplazó sin pasar por los triggers: los tokens del feed de cambios
+        # emitidos antes ya no describen este catálogo
+        reset_change_feed()
+        with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conexion:
+            conexion.execute(db.text("ANALYZE games"))
 
         total = Game.query.count()
-        print(f"✅ ÉXITO: Base de datos poblada con {total} juegos.")
+        print(f"✅ ÉXITO: Base de datos poblada con {total} juegos ({grupos} grupos en game_stats).")
+
+    return filas_por_segundo
+
+def main():
+    parser = argparse.ArgumentParser(description="Pobla la tabla games con datos de prueba")
+    parser.add_argument("--rows", type=int, default=50, help="cantidad de juegos (por defecto 50)")
+    parser.add_argument("--seed", type=int, default=None, help="semilla para datos reproducibles")
+    parser.add_argument("--chunk-size", type=int, default=50000, help="filas por COPY")
+    parser.add_argument("--workers", type=int, default=1, help="procesos de carga en paralelo")
+    parser.add_argument("--keep-indexes", action="store_true",
+                        help="no eliminar los índices secundarios durante la carga")
+    args = parser.parse_args()
+    generar_datos_prueba(
+        args.rows, args.seed, args.chunk_size, args.workers, recrear_indices=not args.keep_indexes
+    )
 
 if __name__ == '__main__':
-    generar_datos_prueba()
\ No newline at end of file
+    main()